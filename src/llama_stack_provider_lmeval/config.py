@@ -2,17 +2,65 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Annotated, Any
 
-from pydantic import Field
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from .compat import BenchmarkConfig, EvalCandidate, json_schema_type
 from .errors import LMEvalConfigError
 
 
+def _nonempty(value: str) -> str:
+    """Reject empty or blank strings"""
+    if not value.strip():
+        raise ValueError("must be provided")
+    return value
+
+
+# String that must not be empty, validated as part of the Pydantic core schema
+NonEmptyStr = Annotated[str, AfterValidator(_nonempty)]
+
+# Environment variables as (name, value) pairs
+EnvVars = tuple[tuple[str, str], ...]
+
+
+def env_vars_from_dicts(items: Any) -> EnvVars:
+    """Normalize environment variables into a tuple of (name, value) pairs.
+
+    Accepts ``[{"name": ..., "value": ...}]`` entries as well as two-item
+    sequences, ``None`` becomes an empty tuple.
+
+    Raises:
+        ValueError: If an entry has no string name and value (e.g. a secret
+            reference, which must be passed through ``metadata["env"]`` instead)
+    """
+    if items is None:
+        return ()
+    if not isinstance(items, list | tuple):
+        raise ValueError("env_vars must be a list of name/value entries")
+
+    env_vars: list[tuple[str, str]] = []
+    for item in items:
+        if isinstance(item, dict):
+            name, value = item.get("name"), item.get("value")
+        elif isinstance(item, list | tuple) and len(item) == 2:
+            name, value = item
+        else:
+            name, value = None, None
+
+        if not isinstance(name, str) or not isinstance(value, str):
+            raise ValueError(
+                "env_vars entries must have a string name and value, "
+                "use metadata['env'] for secret references"
+            )
+        env_vars.append((name, value))
+    return tuple(env_vars)
+
+
 @json_schema_type
-@dataclass
+@dataclass(slots=True)
 class TLSConfig:
     """TLS configuration for the LMEval provider."""
 
@@ -60,7 +108,6 @@ class TLSConfig:
 
 
 @json_schema_type
-@dataclass
 class LMEvalBenchmarkConfig(BenchmarkConfig):
     """Configuration for LMEval benchmarkd
 
@@ -70,45 +117,60 @@ class LMEvalBenchmarkConfig(BenchmarkConfig):
     - env: Dictionary of environment variables to pass to the evaluation pod
            (e.g., {'DK_BENCH_DATASET_PATH': '', 'JUDGE_MODEL_URL': ''})
     - tokenizer: Custom tokenizer to use for the model
+
+    Internal callers holding already-validated data can skip validation with
+    ``LMEvalBenchmarkConfig.model_construct(...)``.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     # K8s specific configuration
     eval_candidate: EvalCandidate
-    model: str = Field(description="Name of the model")
+    model: NonEmptyStr = Field(description="Name of the model")
     # FIXME: mode is only present temporarily and for debug purposes, it will be removed
     # mode: str = Field(description="Mode of the benchmark", default="production")
-    env_vars: list[dict[str, str]] | None = None
+    env_vars: Annotated[EnvVars, BeforeValidator(env_vars_from_dicts)] = ()
     metadata: dict[str, Any] | None = None
 
-    def __post_init__(self):
-        """Validate the configuration"""
-        if not self.model:
-            raise ValueError("model must be provided")
+
+@json_schema_type
+class K8sTaskList(BaseModel):
+    """Task list for the Kubernetes LMEvalJob CR"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    taskNames: list[NonEmptyStr] = Field(min_length=1)
+    customTasks: dict[str, Any] | None = None
+
+
+def _require_task_list(value: K8sTaskList | None) -> K8sTaskList:
+    """Reject a missing task list"""
+    if value is None:
+        raise ValueError("taskList.taskNames must be provided")
+    return value
 
 
 @json_schema_type
-@dataclass
+@pydantic_dataclass(slots=True)
 class K8sLMEvalConfig:
     """Configuration for Kubernetes LMEvalJob CR"""
 
-    model: str
-    model_args: list[dict[str, str]] | None = field(default_factory=list)
-    task_list: dict[str, list[str]] | None = None
+    model: NonEmptyStr
+    model_args: list[dict[str, str]] | None = Field(default_factory=list)
+    task_list: Annotated[K8sTaskList | None, AfterValidator(_require_task_list)] = (
+        Field(default=None, validate_default=True)
+    )
     log_samples: bool = True
     namespace: str = "default"
-    env_vars: list[dict[str, str]] | None = None
+    env_vars: Annotated[EnvVars, BeforeValidator(env_vars_from_dicts)] = ()
 
-    def __post_init__(self):
-        """Validate the configuration"""
-        if not self.task_list or not self.task_list.get("taskNames"):
-            raise ValueError("taskList.taskNames must be provided")
 
-        if not self.model:
-            raise ValueError("model must be provided")
+# Accepted types for LMEvalEvalProviderConfig.tls, checked with a single isinstance
+_ALLOWED_TLS_TYPES = (TLSConfig, type(None))
 
 
 @json_schema_type
-@dataclass
+@dataclass(slots=True)
 class LMEvalEvalProviderConfig:
     """LMEval Provider configuration"""
 
@@ -130,10 +192,23 @@ class LMEvalEvalProviderConfig:
         if not isinstance(self.use_k8s, bool):
             raise LMEvalConfigError("use_k8s must be a boolean")
 
+        # Provider configs from run.yaml arrive with tls as a plain mapping
+        if isinstance(self.tls, dict):
+            try:
+                self.tls = TLSConfig(**self.tls)
+            except TypeError as e:
+                raise LMEvalConfigError(f"Invalid tls configuration: {e}") from e
+
+        if not isinstance(self.tls, _ALLOWED_TLS_TYPES):
+            raise LMEvalConfigError("tls must be a TLSConfig or None")
+
 
 __all__ = [
+    "EnvVars",
+    "env_vars_from_dicts",
     "TLSConfig",
     "LMEvalBenchmarkConfig",
+    "K8sTaskList",
     "K8sLMEvalConfig",
     "LMEvalEvalProviderConfig",
 ]
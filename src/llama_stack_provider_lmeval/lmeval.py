@@ -352,16 +352,19 @@ class LMEvalCRBuilder:
         else:
             return f"{cleaned_url}/v1/completions"
 
-    def _create_model_args(
+    def _collect_model_args(
         self, base_url: str | None, benchmark_config: BenchmarkConfig
-    ) -> list[ModelArg]:
-        """Create model arguments for the LMEvalJob CR."""
-        model_args = [
-            ModelArg(
-                name="base_url",
-                value=self._build_openai_url(base_url) if base_url is not None else "",
+    ) -> dict[str, str]:
+        """Collect model arguments for the LMEvalJob CR, keyed by name.
+
+        Later assignments to an existing name override its value while keeping
+        its original position.
+        """
+        model_args = {
+            "base_url": (
+                self._build_openai_url(base_url) if base_url is not None else ""
             ),
-        ]
+        }
 
         # Add model name if specified in benchmark config
         model_name = None
@@ -378,30 +381,33 @@ class LMEvalCRBuilder:
                 model_name = benchmark_config.eval_candidate.model
 
         if model_name:
-            model_args.append(ModelArg(name="model", value=model_name))
+            model_args["model"] = model_name
 
-        # Add custom model args from benchmark config, avoiding duplicate keys
+        # Add custom model args from benchmark config, overriding duplicate keys
         if hasattr(benchmark_config, "model_args") and benchmark_config.model_args:
-            existing_arg_names = {arg.name for arg in model_args}
             for arg in benchmark_config.model_args:
-                if arg.name not in existing_arg_names:
-                    model_args.append(arg)
-                else:
-                    # Optionally, update the value for existing keys instead of skipping
-                    for i, existing_arg in enumerate(model_args):
-                        if existing_arg.name == arg.name:
-                            model_args[i] = arg
-                            break
+                model_args[arg.name] = arg.value
 
         # Add TLS configuration
         env_tls_config = _get_tls_config_from_env(self._config)
         if env_tls_config is not None:
-            model_args.append(
-                ModelArg(name="verify_certificate", value=str(env_tls_config))
-            )
+            model_args["verify_certificate"] = str(env_tls_config)
 
         return model_args
 
+    @staticmethod
+    def _finalize_model_args(model_args: dict[str, str]) -> list[ModelArg]:
+        """Convert collected model arguments into the CR list representation."""
+        return [ModelArg(name=name, value=value) for name, value in model_args.items()]
+
+    def _create_model_args(
+        self, base_url: str | None, benchmark_config: BenchmarkConfig
+    ) -> list[ModelArg]:
+        """Create model arguments for the LMEvalJob CR."""
+        return self._finalize_model_args(
+            self._collect_model_args(base_url, benchmark_config)
+        )
+
     def _collect_env_vars(
         self, task_config: BenchmarkConfig, stored_benchmark: Benchmark | None
     ) -> list[dict[str, Any]]:
@@ -414,9 +420,15 @@ class LMEvalCRBuilder:
         Returns:
             List of environment variables
         """
-        env_vars = []
+        env_vars: list[dict[str, Any]] = []
         if hasattr(task_config, "env_vars") and task_config.env_vars:
-            env_vars = task_config.env_vars
+            for env_var in task_config.env_vars:
+                if isinstance(env_var, tuple):
+                    # (name, value) pairs from the LMEval config classes
+                    name, value = env_var
+                    env_vars.append({"name": name, "value": value})
+                else:
+                    env_vars.append(env_var)
 
         # Get environment variables from metadata
         if hasattr(task_config, "metadata") and task_config.metadata:
@@ -751,8 +763,8 @@ class LMEvalCRBuilder:
 
         logger.info("Final benchmark_tls value for model args: %s", benchmark_tls)
 
-        # Create model args
-        model_args = self._create_model_args(base_url, task_config)
+        # Collect model args by name, they are only turned into a list for the CR
+        model_args = self._collect_model_args(base_url, task_config)
 
         if (
             stored_benchmark is not None
@@ -765,7 +777,7 @@ class LMEvalCRBuilder:
                 logger.debug(
                     "Using custom tokenizer from metadata: %s", tokenizer_value
                 )
-                model_args.append(ModelArg(name="tokenizer", value=tokenizer_value))
+                model_args["tokenizer"] = tokenizer_value
 
         # Add tokenized_requests parameter if present in metadata
         if (
@@ -783,7 +795,7 @@ class LMEvalCRBuilder:
             ):
                 value_str = str(tokenized_requests_value)
                 logger.debug("Using tokenized_requests from metadata: %s", value_str)
-                model_args.append(ModelArg(name="tokenized_requests", value=value_str))
+                model_args["tokenized_requests"] = value_str
 
         # Collect environment variables
         env_vars = self._collect_env_vars(task_config, stored_benchmark)
@@ -810,7 +822,7 @@ class LMEvalCRBuilder:
         # Create CR spec parameters
         spec_params = {
             "taskList": TaskList(**task_list_params),
-            "modelArgs": model_args,
+            "modelArgs": self._finalize_model_args(model_args),
             "pod": pod_config,
         }
 
@@ -931,7 +943,7 @@ class LMEval(Eval, BenchmarksProtocolPrivate):
         self._config = config
         self._namespace: str | None = None
 
-        logger.debug("LMEval provider config values: %s", vars(self._config))
+        logger.debug("LMEval provider config values: %s", self._config)
         self.benchmarks: dict[str, Benchmark] = {}
         self._jobs: list[Job] = []
         self._job_metadata: dict[str, dict[str, Any]] = {}
@@ -1172,36 +1184,6 @@ class LMEval(Eval, BenchmarksProtocolPrivate):
         logger.debug("Using example limit from config: %s", config_limit)
         return config_limit
 
-    def _process_environment_vars(self, benchmark_config: BenchmarkConfig) -> None:
-        """Process environment variables from metadata.
-
-        Args:
-            benchmark_config: Benchmark configuration
-        """
-        if not (
-            hasattr(benchmark_config, "metadata")
-            and benchmark_config.metadata
-            and "env" in benchmark_config.metadata
-        ):
-            return
-
-        env_data = benchmark_config.metadata.get("env", {})
-        if not isinstance(env_data, dict):
-            return
-
-        if (
-            not hasattr(benchmark_config, "env_vars")
-            or benchmark_config.env_vars is None
-        ):
-            benchmark_config.env_vars = []
-
-        for key, value in env_data.items():
-            benchmark_config.env_vars.append({"name": key, "value": str(value)})
-
-        logger.debug(
-            "Added environment variables from metadata.env to benchmark_config"
-        )
-
     async def run_eval(
         self,
         benchmark_id: str,
@@ -1229,7 +1211,6 @@ class LMEval(Eval, BenchmarksProtocolPrivate):
         logger.info("Running evaluation for benchmark %s", benchmark_id)
 
         config_limit = self._process_benchmark_config(benchmark_config)
-        self._process_environment_vars(benchmark_config)
 
         if hasattr(benchmark_config, "metadata") and benchmark_config.metadata:
             logger.debug(
@@ -1,12 +1,15 @@
 from .compat import Api, ProviderSpec, RemoteProviderSpec
 
+# The provider spec is static, build it once at import time
+_PROVIDER_SPEC = RemoteProviderSpec(
+    api=Api.eval,
+    provider_type="remote::trustyai_lmeval",
+    adapter_type="lmeval",
+    pip_packages=["kubernetes"],
+    config_class="llama_stack_provider_lmeval.config.LMEvalEvalProviderConfig",
+    module="llama_stack_provider_lmeval",
+)
+
 
 def get_provider_spec() -> ProviderSpec:
-    return RemoteProviderSpec(
-        api=Api.eval,
-        provider_type="remote::trustyai_lmeval",
-        adapter_type="lmeval",
-        pip_packages=["kubernetes"],
-        config_class="llama_stack_provider_lmeval.config.LMEvalEvalProviderConfig",
-        module="llama_stack_provider_lmeval",
-    )
+    return _PROVIDER_SPEC
@@ -237,6 +237,24 @@ class TestBaseUrlHandling(unittest.TestCase):
             self.assertIsInstance(arg.name, str)
             self.assertIsInstance(arg.value, str)
 
+    def test_create_model_args_overrides_duplicate_names(self):
+        """Test custom model args override existing names in place."""
+        self.mock_benchmark_config.model_args = [
+            ModelArg(name="model", value="override-model"),
+            ModelArg(name="tokenizer", value="custom-tokenizer"),
+        ]
+
+        result = self.builder._create_model_args(BASE_URL, self.mock_benchmark_config)
+
+        self.assertEqual(
+            [(arg.name, arg.value) for arg in result],
+            [
+                ("base_url", f"{BASE_URL}/v1/completions"),
+                ("model", "override-model"),
+                ("tokenizer", "custom-tokenizer"),
+            ],
+        )
+
     def test_create_model_args_fallback_to_provider_tls_when_benchmark_tls_none(self):
         """Test _create_model_args falls back to provider config TLS when benchmark_tls is None."""
         model_name = "test-model"
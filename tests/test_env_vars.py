@@ -1,10 +1,19 @@
+import asyncio
 import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, "src")
 
-from llama_stack_provider_lmeval.lmeval import LMEvalCRBuilder
+from pydantic import ValidationError
+
+from llama_stack_provider_lmeval.config import (
+    K8sLMEvalConfig,
+    LMEvalBenchmarkConfig,
+    LMEvalEvalProviderConfig,
+    env_vars_from_dicts,
+)
+from llama_stack_provider_lmeval.lmeval import LMEval, LMEvalCRBuilder
 
 
 class TestEnvironmentVariables(unittest.TestCase):
@@ -338,6 +347,22 @@ class TestEnvironmentVariables(unittest.TestCase):
         )
         self.assertEqual(secret_vars["JUDGE_API_KEY"]["secret"]["key"], "token")
 
+    def test_collect_env_vars_from_name_value_pairs(self):
+        """Test collecting environment variables given as (name, value) pairs."""
+        task_config = MagicMock()
+        task_config.env_vars = (("SIMPLE_VAR", "simple_value"), ("OTHER_VAR", "other"))
+        task_config.metadata = {}
+
+        env_vars = self.cr_builder._collect_env_vars(task_config, None)
+
+        self.assertEqual(
+            env_vars,
+            [
+                {"name": "SIMPLE_VAR", "value": "simple_value"},
+                {"name": "OTHER_VAR", "value": "other"},
+            ],
+        )
+
     def test_full_integration_metadata_to_cr(self):
         """Test full integration from metadata dictionary to final CR environment variables."""
         # Create a mock task config with metadata
@@ -413,6 +438,120 @@ class TestEnvironmentVariables(unittest.TestCase):
             self.assertNotIn("secret-key", formatted_message)
             self.assertNotIn("valueFrom", formatted_message)
 
+    def test_run_eval_emits_metadata_env_once(self):
+        """Test metadata env vars, including secrets, are emitted once by run_eval."""
+        provider = LMEval(config=LMEvalEvalProviderConfig(namespace="test-namespace"))
+        provider._cr_builder = self.cr_builder
+        benchmark_config = LMEvalBenchmarkConfig(
+            eval_candidate={
+                "type": "model",
+                "model": "test-model",
+                "sampling_params": {},
+            },
+            model="test-model",
+            metadata={
+                "env": {
+                    "SIMPLE_VAR": "simple_value",
+                    "SECRET_VAR": {
+                        "secret": {"name": "my-secret", "key": "secret-key"}
+                    },
+                }
+            },
+        )
+
+        with (
+            patch.object(provider, "_ensure_k8s_initialized"),
+            patch.object(provider, "_deploy_lmeval_cr") as mock_deploy,
+        ):
+            asyncio.run(provider.run_eval("lmeval::mmlu", benchmark_config))
+
+        cr = mock_deploy.call_args[0][0]
+        env = cr["spec"]["pod"]["container"]["env"]
+        self.assertEqual([e["name"] for e in env], ["SIMPLE_VAR", "SECRET_VAR"])
+        self.assertEqual(env[0]["value"], "simple_value")
+        self.assertEqual(
+            env[1]["valueFrom"],
+            {"secretKeyRef": {"name": "my-secret", "key": "secret-key"}},
+        )
+
+
+class TestEnvVarsFromDicts(unittest.TestCase):
+    """Test conversion of environment variables into (name, value) pairs."""
+
+    def test_dict_entries(self):
+        """Test name/value dicts become pairs."""
+        result = env_vars_from_dicts(
+            [{"name": "A", "value": "1"}, {"name": "B", "value": "2"}]
+        )
+        self.assertEqual(result, (("A", "1"), ("B", "2")))
+
+    def test_none_and_empty(self):
+        """Test None and empty inputs become an empty tuple."""
+        self.assertEqual(env_vars_from_dicts(None), ())
+        self.assertEqual(env_vars_from_dicts([]), ())
+
+    def test_pairs_are_normalized_to_tuples(self):
+        """Test list pairs are normalized into a hashable tuple of tuples."""
+        result = env_vars_from_dicts([["A", "1"]])
+        self.assertEqual(result, (("A", "1"),))
+        self.assertIsInstance(result[0], tuple)
+        hash(result)
+
+    def test_non_string_values_are_rejected(self):
+        """Test None and non-string values are rejected, not stringified."""
+        for items in (
+            [{"name": "A", "value": None}],
+            [{"name": "A", "value": 1}],
+            [["A", 1]],
+        ):
+            with self.subTest(items=items):
+                with self.assertRaises(ValueError):
+                    env_vars_from_dicts(items)
+
+    def test_secret_entries_are_rejected(self):
+        """Test secret references are rejected with a pointer to metadata env."""
+        with self.assertRaises(ValueError) as excinfo:
+            env_vars_from_dicts(
+                [{"name": "A", "secret": {"name": "my-secret", "key": "key"}}]
+            )
+        self.assertIn("metadata['env']", str(excinfo.exception))
+
+    def test_benchmark_config_converts_dicts(self):
+        """Test LMEvalBenchmarkConfig converts env_vars dicts on validation."""
+        config = LMEvalBenchmarkConfig(
+            eval_candidate={
+                "type": "model",
+                "model": "test-model",
+                "sampling_params": {},
+            },
+            model="test-model",
+            env_vars=[{"name": "A", "value": "1"}],
+        )
+        self.assertEqual(config.env_vars, (("A", "1"),))
+
+    def test_benchmark_config_rejects_secret_entries(self):
+        """Test LMEvalBenchmarkConfig rejects secret env_vars entries."""
+        with self.assertRaises(ValidationError):
+            LMEvalBenchmarkConfig(
+                eval_candidate={
+                    "type": "model",
+                    "model": "test-model",
+                    "sampling_params": {},
+                },
+                model="test-model",
+                env_vars=[{"name": "A", "secret": {"name": "s", "key": "k"}}],
+            )
+
+    def test_k8s_config_normalizes_env_vars(self):
+        """Test K8sLMEvalConfig stores env_vars as a tuple of tuples."""
+        config = K8sLMEvalConfig(
+            model="test-model",
+            task_list={"taskNames": ["mmlu"]},
+            env_vars=[["A", "1"]],
+        )
+        self.assertEqual(config.env_vars, (("A", "1"),))
+        self.assertIsInstance(config.env_vars, tuple)
+
 
 if __name__ == "__main__":
     unittest.main()
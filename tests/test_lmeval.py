@@ -1,13 +1,48 @@
 """Tests for the LMEval provider functionality."""
 
 import unittest
+from dataclasses import dataclass, field
 from unittest.mock import patch, MagicMock
 import os
 
-from src.llama_stack_provider_lmeval.config import LMEvalEvalProviderConfig, TLSConfig
+from pydantic import ValidationError
+
+from src.llama_stack_provider_lmeval.config import (
+    K8sLMEvalConfig,
+    K8sTaskList,
+    LMEvalBenchmarkConfig,
+    LMEvalEvalProviderConfig,
+    TLSConfig,
+)
 from src.llama_stack_provider_lmeval.lmeval import LMEvalCRBuilder, _get_tls_config_from_env
 
 
+@dataclass(slots=True, frozen=True)
+class _FakeEvalCandidate:
+    """Lightweight stand-in for an EvalCandidate."""
+
+    type: str = "model"
+    model: str = "test-model"
+    sampling_params: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class _FakeBenchmarkConfig:
+    """Lightweight stand-in for a BenchmarkConfig."""
+
+    eval_candidate: _FakeEvalCandidate = field(default_factory=_FakeEvalCandidate)
+    model: str | None = "test-model"
+    env_vars: tuple = ()
+    metadata: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class _FakeStoredBenchmark:
+    """Lightweight stand-in for a stored Benchmark."""
+
+    metadata: dict = field(default_factory=dict)
+
+
 class TestTLSConfigFromEnv(unittest.TestCase):
     """Test the _get_tls_config_from_env function."""
 
@@ -594,16 +629,8 @@ class TestLMEvalCRBuilder(unittest.TestCase):
             namespace=self.namespace, service_account=self.service_account
         )
 
-        self.benchmark_config = MagicMock()
-        self.benchmark_config.eval_candidate.type = "model"
-        self.benchmark_config.eval_candidate.model = "test-model"
-        self.benchmark_config.eval_candidate.sampling_params = {}
-        self.benchmark_config.env_vars = []
-        self.benchmark_config.metadata = {}
-        self.benchmark_config.model = "test-model"  # Add this for _create_model_args
-
-        self.stored_benchmark = MagicMock()
-        self.stored_benchmark.metadata = {}
+        self.benchmark_config = _FakeBenchmarkConfig()
+        self.stored_benchmark = _FakeStoredBenchmark()
 
     def test_create_cr_with_model_in_eval_candidate(self):
         """Test that model is correctly extracted from eval_candidate.model."""
@@ -614,22 +641,10 @@ class TestLMEvalCRBuilder(unittest.TestCase):
         self.builder._config = config
 
         # Create a benchmark config without direct model attribute
-        benchmark_config = MagicMock()
-        
-        # Create eval_candidate as a simple object with the required attributes
-        class EvalCandidate:
-            def __init__(self):
-                self.type = "model"
-                self.model = "eval-candidate-model"
-                self.sampling_params = {}
-        
-        eval_candidate = EvalCandidate()
-        benchmark_config.eval_candidate = eval_candidate
-        benchmark_config.env_vars = []
-        benchmark_config.metadata = {}
-        # Ensure hasattr works correctly for the mock
-        benchmark_config.model = None
-        # Don't set benchmark_config.model directly
+        benchmark_config = _FakeBenchmarkConfig(
+            eval_candidate=_FakeEvalCandidate(model="eval-candidate-model"),
+            model=None,
+        )
 
         cr = self.builder.create_cr(
             benchmark_id="lmeval::mmlu",
@@ -903,6 +918,66 @@ class TestLMEvalCRBuilder(unittest.TestCase):
         # Verify the error message
         self.assertIn("Both cert_file and cert_secret must be set when TLS is enabled and certificates are specified", str(excinfo.exception))
 
+    def test_provider_config_rejects_non_tlsconfig_tls(self):
+        """Test a TLS setting that is not a TLSConfig raises a validation error."""
+        from src.llama_stack_provider_lmeval.config import LMEvalConfigError
+
+        with self.assertRaises(LMEvalConfigError) as excinfo:
+            LMEvalEvalProviderConfig(
+                namespace=self.namespace,
+                service_account=self.service_account,
+                tls=True,
+            )
+
+        self.assertIn("tls must be a TLSConfig or None", str(excinfo.exception))
+
+    def test_provider_config_converts_dict_tls(self):
+        """Test a TLS mapping, as read from run.yaml, is converted to a TLSConfig."""
+        config = LMEvalEvalProviderConfig(
+            namespace=self.namespace,
+            service_account=self.service_account,
+            tls={
+                "enable": True,
+                "cert_file": "custom-ca.pem",
+                "cert_secret": "vllm-ca-bundle",
+            },
+        )
+
+        self.assertIsInstance(config.tls, TLSConfig)
+        self.assertTrue(config.tls.enable)
+        self.assertEqual(config.tls.cert_file, "custom-ca.pem")
+        self.assertEqual(config.tls.cert_secret, "vllm-ca-bundle")
+
+    def test_provider_config_validates_dict_tls(self):
+        """Test a TLS mapping goes through TLSConfig validation."""
+        from src.llama_stack_provider_lmeval.config import LMEvalConfigError
+
+        with self.assertRaises(LMEvalConfigError) as excinfo:
+            LMEvalEvalProviderConfig(
+                namespace=self.namespace,
+                service_account=self.service_account,
+                tls={"enable": True, "cert_file": "custom-ca.pem"},
+            )
+
+        self.assertIn(
+            "Both cert_file and cert_secret must be set", str(excinfo.exception)
+        )
+
+    def test_benchmark_config_rejects_empty_model(self):
+        """Test an empty model name raises a validation error."""
+        with self.assertRaises(ValidationError) as excinfo:
+            LMEvalBenchmarkConfig(
+                eval_candidate={
+                    "type": "model",
+                    "model": "test-model",
+                    "sampling_params": {},
+                },
+                model="",
+            )
+
+        self.assertIn("model", str(excinfo.exception))
+        self.assertIn("must be provided", str(excinfo.exception))
+
     def test_create_cr_with_provider_config_tls_missing_cert_secret(self):
         """Test TLS enabled but cert_secret missing, should raise validation error."""
         from src.llama_stack_provider_lmeval.config import LMEvalConfigError
@@ -1152,8 +1227,6 @@ class TestLMEvalCRBuilder(unittest.TestCase):
         )
         self.builder._config = config
 
-        self.benchmark_config.metadata = {}
-
         cr = self.builder.create_cr(
             benchmark_id="lmeval::mmlu",
             task_config=self.benchmark_config,
@@ -1181,7 +1254,7 @@ class TestLMEvalCRBuilder(unittest.TestCase):
         self.builder._config = config
 
         tokenizer = "google/flan-t5-base"
-        self.stored_benchmark.metadata = {"tokenizer": tokenizer}
+        self.stored_benchmark = _FakeStoredBenchmark(metadata={"tokenizer": tokenizer})
 
         cr = self.builder.create_cr(
             benchmark_id="lmeval::mmlu",
@@ -1214,7 +1287,9 @@ class TestLMEvalCRBuilder(unittest.TestCase):
         )
         self.builder._config = config
 
-        self.stored_benchmark.metadata = {"tokenized_requests": False}
+        self.stored_benchmark = _FakeStoredBenchmark(
+            metadata={"tokenized_requests": False}
+        )
 
         cr = self.builder.create_cr(
             benchmark_id="lmeval::mmlu",
@@ -1238,6 +1313,102 @@ class TestLMEvalCRBuilder(unittest.TestCase):
             "tokenized_requests value should match the value specified in the request's metadata",
         )
 
+    @patch("src.llama_stack_provider_lmeval.lmeval.logger")
+    def test_create_cr_repeated_calls_return_independent_crs(self, mock_logger):
+        """Identical inputs render the same spec but distinct, independent CRs."""
+        config = LMEvalEvalProviderConfig(
+            namespace=self.namespace,
+            service_account=self.service_account,
+        )
+        self.builder._config = config
+
+        crs = [
+            self.builder.create_cr(
+                benchmark_id="lmeval::mmlu",
+                task_config=self.benchmark_config,
+                base_url="http://my-model-url",
+                limit="10",
+                stored_benchmark=self.stored_benchmark,
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(crs[0]["spec"], crs[1]["spec"])
+        self.assertNotEqual(
+            crs[0]["metadata"]["name"],
+            crs[1]["metadata"]["name"],
+            "Each CR should get its own job name",
+        )
+
+        crs[0]["spec"]["offline"] = {"storage": {"pvcName": "some-pvc"}}
+        self.assertIsNone(crs[1]["spec"].get("offline"))
+
+
+class TestK8sLMEvalConfig(unittest.TestCase):
+    """Test the K8sLMEvalConfig validation."""
+
+    def test_task_list_dict_is_converted(self):
+        """Test a taskList dict, including customTasks, becomes a K8sTaskList."""
+        custom_tasks = {"source": {"git": {"url": "https://example.com/tasks.git"}}}
+        config = K8sLMEvalConfig(
+            model="test-model",
+            task_list={"taskNames": ["mmlu"], "customTasks": custom_tasks},
+        )
+
+        self.assertIsInstance(config.task_list, K8sTaskList)
+        self.assertEqual(config.task_list.taskNames, ["mmlu"])
+        self.assertEqual(config.task_list.customTasks, custom_tasks)
+
+    def test_positional_construction(self):
+        """Test the fields can still be passed positionally."""
+        config = K8sLMEvalConfig("test-model", [], {"taskNames": ["mmlu"]})
+
+        self.assertEqual(config.model, "test-model")
+        self.assertEqual(config.task_list.taskNames, ["mmlu"])
+
+    def test_missing_task_list(self):
+        """Test a missing taskList raises a ValueError."""
+        with self.assertRaises(ValueError) as excinfo:
+            K8sLMEvalConfig(model="test-model")
+
+        self.assertIn("taskList.taskNames must be provided", str(excinfo.exception))
+
+    def test_empty_or_blank_task_names(self):
+        """Test empty and blank task names raise a ValueError."""
+        for task_names in ([], [""], ["mmlu", "  "]):
+            with self.subTest(task_names=task_names):
+                with self.assertRaises(ValueError):
+                    K8sLMEvalConfig(
+                        model="test-model", task_list={"taskNames": task_names}
+                    )
+
+    def test_invalid_task_list_dict(self):
+        """Test unknown taskList keys raise a ValueError."""
+        with self.assertRaises(ValueError) as excinfo:
+            K8sLMEvalConfig(
+                model="test-model",
+                task_list={"taskNames": ["mmlu"], "unknown": True},
+            )
+
+        self.assertIn("unknown", str(excinfo.exception))
+
+    def test_task_names_must_be_a_list(self):
+        """Test a string taskNames is rejected instead of split into characters."""
+        with self.assertRaises(ValueError):
+            K8sLMEvalConfig(model="test-model", task_list={"taskNames": "mmlu"})
+
+    def test_empty_model(self):
+        """Test an empty model raises a ValueError."""
+        with self.assertRaises(ValueError) as excinfo:
+            K8sLMEvalConfig(model="", task_list={"taskNames": ["mmlu"]})
+
+        self.assertIn("must be provided", str(excinfo.exception))
+
+    def test_non_string_model(self):
+        """Test a non-string model raises a ValueError."""
+        with self.assertRaises(ValueError):
+            K8sLMEvalConfig(model=5, task_list={"taskNames": ["mmlu"]})
+
 
 if __name__ == "__main__":
     unittest.main()